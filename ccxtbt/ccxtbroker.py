@@ -123,6 +123,13 @@ class CCXTBroker(with_metaclass(MetaCCXTBroker, BrokerBase)):
             except KeyError:  # might not want to change the mappings
                 pass
 
+        # Resolve the status mappings once as they are checked for every open
+        # order on every bar
+        self._closed_key = self.mappings['closed_order']['key']
+        self._closed_value = self.mappings['closed_order']['value']
+        self._canceled_key = self.mappings['canceled_order']['key']
+        self._canceled_value = self.mappings['canceled_order']['value']
+
         self.store = CCXTStore(**kwargs)
 
         self.currency = self.store.currency
@@ -217,7 +224,7 @@ class CCXTBroker(with_metaclass(MetaCCXTBroker, BrokerBase)):
                 print(json.dumps(ccxt_order, indent=self.indent))
 
             # Check if the order is closed
-            if ccxt_order[self.mappings['closed_order']['key']] == self.mappings['closed_order']['value']:
+            if ccxt_order[self._closed_key] == self._closed_value:
                 pos = self.getposition(o_order.data, clone=False)
                 pos.update(o_order.size, o_order.price)
                 o_order.completed()
@@ -227,7 +234,7 @@ class CCXTBroker(with_metaclass(MetaCCXTBroker, BrokerBase)):
 
             # Manage case when an order is being Canceled from the Exchange
             #  from https://github.com/juancols/bt-ccxt-store/
-            if ccxt_order[self.mappings['canceled_order']['key']] == self.mappings['canceled_order']['value']:
+            if ccxt_order[self._canceled_key] == self._canceled_value:
                 self.open_orders.remove(o_order)
                 o_order.cancel()
                 self.notify(o_order)
@@ -294,17 +301,17 @@ class CCXTBroker(with_metaclass(MetaCCXTBroker, BrokerBase)):
         if self.debug:
             print(json.dumps(ccxt_order, indent=self.indent))
 
-        if ccxt_order[self.mappings['closed_order']['key']] == self.mappings['closed_order']['value']:
+        if ccxt_order[self._closed_key] == self._closed_value:
             return order
 
         ccxt_order = self.store.cancel_order(oID, order.data.p.dataname)
 
         if self.debug:
             print(json.dumps(ccxt_order, indent=self.indent))
-            print('Value Received: {}'.format(ccxt_order[self.mappings['canceled_order']['key']]))
-            print('Value Expected: {}'.format(self.mappings['canceled_order']['value']))
+            print('Value Received: {}'.format(ccxt_order[self._canceled_key]))
+            print('Value Expected: {}'.format(self._canceled_value))
 
-        if ccxt_order[self.mappings['canceled_order']['key']] == self.mappings['canceled_order']['value']:
+        if ccxt_order[self._canceled_key] == self._canceled_value:
             self.open_orders.remove(order)
             order.cancel()
             self.notify(order)
@@ -25,6 +25,7 @@ from __future__ import (absolute_import, division, print_function,
 import time
 from collections import deque
 from datetime import datetime
+from operator import itemgetter
 
 import backtrader as bt
 from backtrader.feed import DataBase
@@ -153,8 +154,14 @@ class CCXTFeed(with_metaclass(MetaCCXTFeed, DataBase)):
                 print('---- NEW REQUEST ----')
                 print('{} - Requesting: Since TS {} Since date {} granularity {}, limit {}, params'.format(
                     datetime.utcnow(), since, since_dt, granularity, limit, self.p.fetch_ohlcv_params))
-                data = sorted(self.store.fetch_ohlcv(self.p.dataname, timeframe=granularity,
-                                                     since=since, limit=limit, params=self.p.fetch_ohlcv_params))
+
+            # Candles only need ordering by timestamp. Sorting on that key
+            # compares plain ints instead of whole ohlcv lists.
+            data = sorted(self.store.fetch_ohlcv(self.p.dataname, timeframe=granularity,
+                                                 since=since, limit=limit, params=self.p.fetch_ohlcv_params),
+                          key=itemgetter(0))
+
+            if self.p.debug:
                 try:
                     for i, ohlcv in enumerate(data):
                         tstamp, open_, high, low, close, volume = ohlcv
@@ -165,10 +172,6 @@ class CCXTFeed(with_metaclass(MetaCCXTFeed, DataBase)):
                 except IndexError:
                     print('Index Error: Data = {}'.format(data))
                 print('---- REQUEST END ----')
-            else:
-
-                data = sorted(self.store.fetch_ohlcv(self.p.dataname, timeframe=granularity,
-                                                     since=since, limit=limit, params=self.p.fetch_ohlcv_params))
 
             # Check to see if dropping the latest candle will help with
             # exchanges which return partial data
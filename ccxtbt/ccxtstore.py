@@ -31,6 +31,8 @@ from backtrader.metabase import MetaParams
 from backtrader.utils.py3 import with_metaclass
 from ccxt.base.errors import NetworkError, ExchangeError
 
+from .ohlcvcache import OHLCVCache
+
 
 class MetaSingleton(MetaParams):
     '''Metaclass to make a metaclassed class a singleton'''
@@ -55,6 +57,9 @@ class CCXTStore(with_metaclass(MetaSingleton, object)):
 
     Added new private_end_point method to allow using any private non-unified end point
 
+    Added ohlcv_cache option. Pass the path of a sqlite file to keep closed
+        candles locally so repeated runs don't download the same history again
+
     '''
 
     # Supported granularities
@@ -95,13 +100,19 @@ class CCXTStore(with_metaclass(MetaSingleton, object)):
         '''Returns broker with *args, **kwargs from registered ``BrokerCls``'''
         return cls.BrokerCls(*args, **kwargs)
 
-    def __init__(self, exchange, currency, config, retries, debug=False, sandbox=False):
+    def __init__(self, exchange, currency, config, retries, debug=False, sandbox=False, ohlcv_cache=None):
         self.exchange = getattr(ccxt, exchange)(config)
         if sandbox:
             self.exchange.set_sandbox_mode(True)
         self.currency = currency
         self.retries = retries
         self.debug = debug
+        self.sandbox = sandbox
+        self.ohlcv_cache = OHLCVCache(ohlcv_cache) if ohlcv_cache else None
+        # Sandbox mode keeps the exchange id, keep testnet candles apart from live ones
+        self._cache_exchange = '{}-sandbox'.format(self.exchange.id) if sandbox else self.exchange.id
+        # Load the markets once up front so later calls reuse the cache
+        self.load_markets()
         balance = self.exchange.fetch_balance() if 'secret' in config else 0
         try:
             if balance == 0 or not balance['free'][currency]:
@@ -141,7 +152,10 @@ class CCXTStore(with_metaclass(MetaSingleton, object)):
             for i in range(self.retries):
                 if self.debug:
                     print('{} - {} - Attempt {}'.format(datetime.now(), method.__name__, i))
-                time.sleep(self.exchange.rateLimit / 1000)
+                # ccxt already spaces out requests when enableRateLimit is set,
+                # so only wait up front if it doesn't or if this is a retry
+                if i or not self.exchange.enableRateLimit:
+                    time.sleep(self.exchange.rateLimit / 1000)
                 try:
                     return method(self, *args, **kwargs)
                 except (NetworkError, ExchangeError):
@@ -150,6 +164,10 @@ class CCXTStore(with_metaclass(MetaSingleton, object)):
 
         return retry_method
 
+    @retry
+    def load_markets(self):
+        return self.exchange.load_markets()
+
     @retry
     def get_wallet_balance(self, currency, params=None):
         balance = self.exchange.fetch_balance(params)
@@ -184,8 +202,25 @@ class CCXTStore(with_metaclass(MetaSingleton, object)):
     def fetch_trades(self, symbol):
         return self.exchange.fetch_trades(symbol)
 
-    @retry
     def fetch_ohlcv(self, symbol, timeframe, since, limit, params={}):
+        if self.ohlcv_cache is None:
+            return self._fetch_ohlcv(symbol, timeframe, since, limit, params)
+
+        # The same symbol can resolve to the spot or the swap market depending
+        # on the defaultType option, key the candles on the market it resolved to
+        market = self.exchange.market(symbol)['symbol']
+        data = self.ohlcv_cache.get(self._cache_exchange, market, timeframe, since, limit, params)
+        if data is not None:
+            if self.debug:
+                print('Cached: {}, TF: {}, Since: {}, Limit: {}'.format(symbol, timeframe, since, limit))
+            return data
+
+        data = self._fetch_ohlcv(symbol, timeframe, since, limit, params)
+        self.ohlcv_cache.put(self._cache_exchange, market, timeframe, data, params)
+        return data
+
+    @retry
+    def _fetch_ohlcv(self, symbol, timeframe, since, limit, params={}):
         if self.debug:
             print('Fetching: {}, TF: {}, Since: {}, Limit: {}'.format(symbol, timeframe, since, limit))
         return self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, since=since, limit=limit, params=params)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; py-indent-offset:4 -*-
+###############################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+
+import json
+import sqlite3
+import time
+
+from ccxt import Exchange
+
+
+class OHLCVCache(object):
+    '''Local sqlite cache for closed OHLCV candles.
+
+    Candles are stored per exchange, symbol, timeframe and extra
+    fetch_ohlcv params. Only candles that closed at least one timeframe ago
+    are stored as these can no longer change. The newest candle of a response
+    may still be partial even after its close time when the exchange lags
+    behind, so it is kept out until the next one has closed as well.
+
+    A request is answered from the cache when it holds an unbroken run of
+    ``limit`` candles starting at ``since``. Anything else, e.g. the most
+    recent candles during live trading, is fetched from the exchange.
+
+    Monthly and yearly timeframes are never cached. Their candles don't have
+    a fixed length so neither the closed check nor the gap check would hold.
+    '''
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS candles ('
+                           'exchange TEXT, symbol TEXT, timeframe TEXT, params TEXT, ts INTEGER, '
+                           'open REAL, high REAL, low REAL, close REAL, volume REAL, '
+                           'PRIMARY KEY (exchange, symbol, timeframe, params, ts))')
+        self._conn.commit()
+
+    @staticmethod
+    def _params_key(params):
+        return json.dumps(params or {}, sort_keys=True)
+
+    @staticmethod
+    def _cacheable(timeframe):
+        # ccxt counts a month as 30 days and a year as 365
+        return timeframe[-1] not in ('M', 'y')
+
+    def get(self, exchange, symbol, timeframe, since, limit, params=None):
+        '''Returns ``limit`` cached candles from ``since`` or ``None`` if the
+        cache can't serve the whole request'''
+        if since is None or not limit or not self._cacheable(timeframe):
+            return None
+
+        tf_ms = Exchange.parse_timeframe(timeframe) * 1000
+        rows = self._conn.execute('SELECT ts, open, high, low, close, volume FROM candles '
+                                  'WHERE exchange = ? AND symbol = ? AND timeframe = ? AND params = ? '
+                                  'AND ts >= ? ORDER BY ts LIMIT ?',
+                                  (exchange, symbol, timeframe, self._params_key(params),
+                                   since, limit)).fetchall()
+
+        # The first candle must be the one the exchange would return for
+        # since and there must be no gaps up to the last one
+        if len(rows) < limit or rows[0][0] - since >= tf_ms or \
+                rows[-1][0] - rows[0][0] != (limit - 1) * tf_ms:
+            return None
+
+        return [list(row) for row in rows]
+
+    def put(self, exchange, symbol, timeframe, ohlcv, params=None):
+        '''Stores the closed candles of a fetch_ohlcv result'''
+        if not self._cacheable(timeframe):
+            return
+
+        tf_ms = Exchange.parse_timeframe(timeframe) * 1000
+        now = int(time.time() * 1000)
+        params = self._params_key(params)
+
+        rows = [(exchange, symbol, timeframe, params) + tuple(candle)
+                for candle in ohlcv if None not in candle and candle[0] + 2 * tf_ms <= now]
+        if rows:
+            self._conn.executemany('INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
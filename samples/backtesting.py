@@ -32,7 +32,7 @@ def main():
                              retries=5,
 
                              # 'apiKey' and 'secret' are skipped
-                             config={'enableRateLimit': True, 'nonce': lambda: str(int(time.time() * 1000))}))
+                             config={'enableRateLimit': True, 'nonce': lambda: str(time.time_ns() // 1000000)}))
 
     # Run the strategy
     cerebro.run()
@@ -8,11 +8,15 @@ import time
 import json
 import logging
 
+# Set CCXT_DEBUG (to anything but 0 or false) to get ccxt's request logging and the store's debug prints
+debug = os.getenv('CCXT_DEBUG', '').lower() not in ('', '0', 'false')
+logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+
+
 class TestStrategy(bt.Strategy):
 
     def __init__(self):
 
-        logging.basicConfig(level=logging.DEBUG)
         self.sold = False
         # To keep track of pending orders and buy price/commission
         self.order = None
@@ -31,20 +35,17 @@ class TestStrategy(bt.Strategy):
             self.order = self.sell(size=2.0, exectype=Order.StopLimit, price=5.475, stopPrice=5.4763)
             self.sold = True
 
-        for data in self.datas:
-
-            print('{} - {} | O: {} H: {} L: {} C: {} V:{}'.format(data.datetime.datetime(),
-                                                                                   data._name, data.open[0], data.high[0], data.low[0], data.close[0], data.volume[0]))
+        # Only a single feed is added below
+        data = self.data
+        print(f'{data.datetime.datetime()} - {data._name} | O: {data.open[0]} H: {data.high[0]} '
+              f'L: {data.low[0]} C: {data.close[0]} V:{data.volume[0]}')
 
     def notify_data(self, data, status, *args, **kwargs):
         dn = data._name
         dt = datetime.now()
         msg= 'Data Status: {}, Order Status: {}'.format(data._getstatusname(status), status)
         print(dt,dn,msg)
-        if data._getstatusname(status) == 'LIVE':
-            self.live_data = True
-        else:
-            self.live_data = False
+        self.live_data = status == data.LIVE
 
 
 # absolute dir the script is in
@@ -64,10 +65,10 @@ cerebro.addstrategy(TestStrategy)
 config = {'apiKey': params["binance"]["apikey"],
           'secret': params["binance"]["secret"],
           'enableRateLimit': True,
-          'nonce': lambda: str(int(time.time() * 1000)),
+          'nonce': lambda: str(time.time_ns() // 1000000),
           }
 
-store = CCXTStore(exchange='binance', currency='BNB', config=config, retries=5, debug=True)
+store = CCXTStore(exchange='binance', currency='BNB', config=config, retries=5, debug=debug)
 
 
 # Get the broker and pass any kwargs if needed.
@@ -101,7 +102,7 @@ cerebro.setbroker(broker)
 hist_start_date = datetime.utcnow() - timedelta(minutes=50)
 data = store.getdata(dataname='BNB/USDT', name="BNBUSDT",
                      timeframe=bt.TimeFrame.Minutes, fromdate=hist_start_date,
-                     compression=1, ohlcv_limit=50, drop_newest=True) #, historical=True)
+                     compression=1, ohlcv_limit=1000, drop_newest=True) #, historical=True)
 
 # Add the feed
 cerebro.adddata(data)
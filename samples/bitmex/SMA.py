@@ -25,21 +25,17 @@ class TestStrategy(bt.Strategy):
             # Slow things down.
             cash = 'NA'
 
-        for data in self.datas:
-
-            print('{} - {} | Cash {} | O: {} H: {} L: {} C: {} V:{} SMA:{}'.format(data.datetime.datetime(),
-                                                                                   data._name, cash, data.open[0], data.high[0], data.low[0], data.close[0], data.volume[0],
-                                                                                   self.sma[0]))
+        # Only a single feed is added below
+        data = self.data
+        print(f'{data.datetime.datetime()} - {data._name} | Cash {cash} | O: {data.open[0]} H: {data.high[0]} '
+              f'L: {data.low[0]} C: {data.close[0]} V:{data.volume[0]} SMA:{self.sma[0]}')
 
     def notify_data(self, data, status, *args, **kwargs):
         dn = data._name
         dt = datetime.now()
         msg= 'Data Status: {}'.format(data._getstatusname(status))
         print(dt,dn,msg)
-        if data._getstatusname(status) == 'LIVE':
-            self.live_data = True
-        else:
-            self.live_data = False
+        self.live_data = status == data.LIVE
 
 with open('./samples/params.json', 'r') as f:
     params = json.load(f)
@@ -93,7 +89,7 @@ cerebro.setbroker(broker)
 hist_start_date = datetime.utcnow() - timedelta(minutes=50)
 data = store.getdata(dataname='ETH/USD', name="ETHUSD",
                      timeframe=bt.TimeFrame.Minutes, fromdate=hist_start_date,
-                     compression=1, ohlcv_limit=50, drop_newest=True) #, historical=True)
+                     compression=1, ohlcv_limit=750, drop_newest=True) #, historical=True)
 
 # Add the feed
 cerebro.adddata(data)
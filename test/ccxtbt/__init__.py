@@ -1 +1,100 @@
+import itertools
+from datetime import datetime
+from unittest.mock import DEFAULT, patch
 
+import ccxt
+from backtrader import Cerebro, TimeFrame
+
+from ccxtbt import CCXTFeed, CCXTStore
+
+MINUTE = 60 * 1000
+START = 1546300800000  # 2019-01-01 00:00 UTC
+
+# Every ccxt call is mocked so the nonce only needs to increase
+NONCES = itertools.count(1)
+
+
+def candles(start, count):
+    return [[start + i * MINUTE, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 100.0 + i] for i in range(count)]
+
+
+# Binance lists BNB/USDT as spot market and as perpetual swap
+MARKETS = [
+    {'id': 'BNBUSDT', 'symbol': 'BNB/USDT', 'base': 'BNB', 'quote': 'USDT', 'settle': None,
+     'baseId': 'BNB', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'swap': False, 'future': False,
+     'option': False, 'contract': False, 'linear': None, 'inverse': None, 'active': True,
+     'precision': {}, 'limits': {}},
+    {'id': 'BNBUSDT', 'symbol': 'BNB/USDT:USDT', 'base': 'BNB', 'quote': 'USDT', 'settle': 'USDT',
+     'baseId': 'BNB', 'quoteId': 'USDT', 'settleId': 'USDT', 'type': 'swap', 'spot': False, 'swap': True,
+     'future': False, 'option': False, 'contract': True, 'linear': True, 'inverse': False, 'active': True,
+     'precision': {}, 'limits': {}},
+]
+
+
+def load_markets(self, reload=False, params={}):
+    return self.set_markets(MARKETS)
+
+
+def fetch_ohlcv(symbol, timeframe=None, since=None, limit=None, params={}):
+    return [ohlcv for ohlcv in candles(START, 5) if ohlcv[0] >= since][:limit]
+
+
+class FakeBinanceMixin(object):
+    """
+    Serves markets and candles locally so the tests don't need network access.
+    fetch_balance, load_markets and fetch_ohlcv of ccxt.binance are patched for every test and the mocks of
+    fetch_balance and fetch_ohlcv are available as self.ccxt_mocks.
+    """
+
+    def setUp(self):
+        """
+        The initial balance is fetched in the context of the initialization of the CCXTStore.
+        But as the CCXTStore is a singleton it's normally initialized only once and the instance is reused
+        causing side effects.
+        If the  first test run initializes the store without fetching the balance a subsequent test run
+        would not try to fetch the balance again as the initialization won't happen again.
+        Patching the singleton to None here causes the initialization of the store to happen in every test method
+        and puts back whatever store existed before once the test is done.
+        """
+        singleton_patcher = patch.object(CCXTStore, '_singleton', None)
+        singleton_patcher.start()
+        self.addCleanup(singleton_patcher.stop)
+
+        ccxt_patcher = patch.multiple(ccxt.binance, fetch_balance=DEFAULT, load_markets=load_markets,
+                                      fetch_ohlcv=DEFAULT)
+        self.ccxt_mocks = ccxt_patcher.start()
+        self.addCleanup(ccxt_patcher.stop)
+        self.ccxt_mocks['fetch_ohlcv'].side_effect = fetch_ohlcv
+
+
+def backtesting(strategy, config=None, **kwargs):
+    """
+    Runs ``strategy`` on a fresh store over the BNB/USDT candles from 2019-01-01 00:00 - 00:02.
+    The store is dropped afterwards so the next run starts like a new process would.
+    """
+    if config is None:
+        config = {'enableRateLimit': True, 'nonce': lambda: str(next(NONCES))}
+
+    cerebro = Cerebro()
+
+    cerebro.addstrategy(strategy)
+
+    cerebro.adddata(CCXTFeed(exchange='binance',
+                             dataname='BNB/USDT',
+                             timeframe=TimeFrame.Minutes,
+                             fromdate=datetime(2019, 1, 1, 0, 0),
+                             todate=datetime(2019, 1, 1, 0, 2),
+                             compression=1,
+                             ohlcv_limit=2,
+                             currency='BNB',
+                             config=config,
+                             retries=5,
+                             **kwargs))
+
+    finished_strategies = cerebro.run()
+
+    if CCXTStore._singleton.ohlcv_cache is not None:
+        CCXTStore._singleton.ohlcv_cache.close()
+    CCXTStore._singleton = None
+
+    return finished_strategies
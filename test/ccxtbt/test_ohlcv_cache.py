@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from backtrader import Strategy
+
+from ccxtbt import OHLCVCache
+
+from . import FakeBinanceMixin, MINUTE, NONCES, START, backtesting, candles
+
+
+class TestOHLCVCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = OHLCVCache(':memory:')
+        self.addCleanup(self.cache.close)
+
+    def test_full_page_is_served_from_cache(self):
+        self.cache.put('binance', 'BNB/USDT', '1m', candles(START, 5))
+
+        self.assertEqual(self.cache.get('binance', 'BNB/USDT', '1m', START, 3), candles(START, 3))
+        self.assertEqual(self.cache.get('binance', 'BNB/USDT', '1m', START + MINUTE, 4), candles(START, 5)[1:])
+
+    def test_partial_page_is_a_miss(self):
+        self.cache.put('binance', 'BNB/USDT', '1m', candles(START, 5))
+
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', START, 6))
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', START - MINUTE, 2))
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', None, 2))
+
+    def test_gap_is_a_miss(self):
+        data = candles(START, 5)
+        del data[2]
+        self.cache.put('binance', 'BNB/USDT', '1m', data)
+
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', START, 3))
+
+    def test_keys_are_separate(self):
+        self.cache.put('binance', 'BNB/USDT', '1m', candles(START, 3), params={'price': 'mark'})
+
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', START, 3))
+        self.assertIsNone(self.cache.get('kraken', 'BNB/USDT', '1m', START, 3, params={'price': 'mark'}))
+        self.assertEqual(self.cache.get('binance', 'BNB/USDT', '1m', START, 3, params={'price': 'mark'}),
+                         candles(START, 3))
+
+    @patch('ccxtbt.ohlcvcache.time.time', return_value=(START + 10 * MINUTE + MINUTE // 2) / 1000)
+    def test_open_candle_is_not_stored(self, time_mock):
+        current = START + 10 * MINUTE
+        self.cache.put('binance', 'BNB/USDT', '1m', candles(current - 2 * MINUTE, 3))
+
+        self.assertEqual(self.cache.get('binance', 'BNB/USDT', '1m', current - 2 * MINUTE, 1),
+                         candles(current - 2 * MINUTE, 1))
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', current - 2 * MINUTE, 3))
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', current, 1))
+
+    @patch('ccxtbt.ohlcvcache.time.time', return_value=(START + 10 * MINUTE + 5000) / 1000)
+    def test_just_closed_candle_is_not_stored(self, time_mock):
+        # The previous candle closed 5 seconds ago but the exchange may still be updating it
+        current = START + 10 * MINUTE
+        self.cache.put('binance', 'BNB/USDT', '1m', candles(current - 2 * MINUTE, 2))
+
+        self.assertEqual(self.cache.get('binance', 'BNB/USDT', '1m', current - 2 * MINUTE, 1),
+                         candles(current - 2 * MINUTE, 1))
+        self.assertIsNone(self.cache.get('binance', 'BNB/USDT', '1m', current - MINUTE, 1))
+
+    @patch('ccxtbt.ohlcvcache.time.time', return_value=1551398400)  # 2019-03-01 00:00 UTC
+    def test_calendar_timeframes_are_not_cached(self, time_mock):
+        jan, feb = 1546300800000, 1548979200000
+        for timeframe in ('1M', '1y'):
+            self.cache.put('binance', 'BNB/USDT', timeframe, [[jan, 1.0, 2.0, 0.5, 1.5, 100.0],
+                                                              [feb, 1.5, 2.5, 1.0, 2.0, 110.0]])
+
+            self.assertIsNone(self.cache.get('binance', 'BNB/USDT', timeframe, jan, 1))
+            self.assertIsNone(self.cache.get('binance', 'BNB/USDT', timeframe, jan, 2))
+
+        self.assertEqual(self.cache._conn.execute('SELECT COUNT(*) FROM candles').fetchone()[0], 0)
+
+
+class TestStoreOHLCVCache(FakeBinanceMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(TestStoreOHLCVCache, self).setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, 'ohlcv.sqlite')
+
+    def test_miss_fetches_and_stores(self):
+        self.assertEqual(run(self.path), candles(START, 3))
+
+        self.ccxt_mocks['fetch_ohlcv'].assert_called()
+        cache = OHLCVCache(self.path)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get('binance', 'BNB/USDT', '1m', START, 4), candles(START, 4))
+
+    def test_second_run_is_served_from_cache(self):
+        bars = run(self.path)
+        self.ccxt_mocks['fetch_ohlcv'].reset_mock()
+
+        self.assertEqual(run(self.path), bars)
+        self.ccxt_mocks['fetch_ohlcv'].assert_not_called()
+
+    def test_without_cache(self):
+        self.assertEqual(run(None), candles(START, 3))
+        self.ccxt_mocks['fetch_ohlcv'].reset_mock()
+
+        self.assertEqual(run(None), candles(START, 3))
+        self.ccxt_mocks['fetch_ohlcv'].assert_called()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_sandbox_candles_are_kept_apart(self):
+        sandbox_bars = run(self.path, sandbox=True)
+        cache = OHLCVCache(self.path)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get('binance-sandbox', 'BNB/USDT', '1m', START, 2), candles(START, 2))
+        self.assertIsNone(cache.get('binance', 'BNB/USDT', '1m', START, 2))
+        self.ccxt_mocks['fetch_ohlcv'].reset_mock()
+
+        self.assertEqual(run(self.path), sandbox_bars)
+        self.ccxt_mocks['fetch_ohlcv'].assert_called()
+        self.assertEqual(cache.get('binance', 'BNB/USDT', '1m', START, 2), candles(START, 2))
+
+    def test_futures_candles_are_kept_apart(self):
+        config = {'enableRateLimit': True, 'options': {'defaultType': 'future'}, 'nonce': lambda: str(next(NONCES))}
+        futures_bars = run(self.path, config=config)
+        cache = OHLCVCache(self.path)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get('binance', 'BNB/USDT:USDT', '1m', START, 2), candles(START, 2))
+        self.assertIsNone(cache.get('binance', 'BNB/USDT', '1m', START, 2))
+        self.ccxt_mocks['fetch_ohlcv'].reset_mock()
+
+        self.assertEqual(run(self.path), futures_bars)
+        self.ccxt_mocks['fetch_ohlcv'].assert_called()
+        self.assertEqual(cache.get('binance', 'BNB/USDT', '1m', START, 2), candles(START, 2))
+
+
+class BarsStrategy(Strategy):
+
+    def __init__(self):
+        self.bars = []
+
+    def next(self):
+        data = self.datas[0]
+        tstamp = int((data.datetime.datetime(0) - datetime(1970, 1, 1)).total_seconds() * 1000)
+        self.bars.append([tstamp, data.open[0], data.high[0], data.low[0], data.close[0], data.volume[0]])
+
+
+def run(ohlcv_cache, **kwargs):
+    return backtesting(BarsStrategy, ohlcv_cache=ohlcv_cache, **kwargs)[0].bars
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,11 @@
-import time
 import unittest
-from datetime import datetime
-from unittest.mock import patch
 
-from backtrader import Strategy, Cerebro, TimeFrame
+from backtrader import Strategy
 
-from ccxtbt import CCXTFeed, CCXTStore
+from . import FakeBinanceMixin, NONCES, backtesting
 
 
-class TestFeedInitialFetchBalance(unittest.TestCase):
+class TestFeedInitialFetchBalance(FakeBinanceMixin, unittest.TestCase):
     """
     At least at Binance and probably on other exchanges too fetching ohlcv data doesn't need authentication
     while obviously fetching the balance of ones account does need authentication.
@@ -21,19 +18,7 @@ class TestFeedInitialFetchBalance(unittest.TestCase):
     ohlcv data to try out this lib.
     """
 
-    def setUp(self):
-        """
-        The initial balance is fetched in the context of the initialization of the CCXTStore.
-        But as the CCXTStore is a singleton it's normally initialized only once and the instance is reused
-        causing side effects.
-        If the  first test run initializes the store without fetching the balance a subsequent test run
-        would not try to fetch the balance again as the initialization won't happen again.
-        Resetting the singleton to None here causes the initialization of the store to happen in every test method.
-        """
-        CCXTStore._singleton = None
-
-    @patch('ccxt.binance.fetch_balance')
-    def test_fetch_balance_throws_error(self, fetch_balance_mock):
+    def test_fetch_balance_throws_error(self):
         """
         If API keys are provided the store is expected to fetch the balance.
         """
@@ -42,23 +27,24 @@ class TestFeedInitialFetchBalance(unittest.TestCase):
             'apikey': 'an-api-key',
             'secret': 'an-api-secret',
             'enableRateLimit': True,
-            'nonce': lambda: str(int(time.time() * 1000))
+            'nonce': lambda: str(next(NONCES))
         }
-        backtesting(config)
+        backtesting(TestStrategy, config)
 
-        fetch_balance_mock.assert_called_once()
+        self.ccxt_mocks['fetch_balance'].assert_called_once()
 
     def test_default_fetch_balance_param(self):
         """
-        If API keys are provided the store is expected to
+        If no API keys are provided the store is expected to
         not fetch the balance and load the ohlcv data without them.
         """
         config = {
             'enableRateLimit': True,
-            'nonce': lambda: str(int(time.time() * 1000))
+            'nonce': lambda: str(next(NONCES))
         }
-        finished_strategies = backtesting(config)
+        finished_strategies = backtesting(TestStrategy, config)
         self.assertEqual(finished_strategies[0].next_runs, 3)
+        self.ccxt_mocks['fetch_balance'].assert_not_called()
 
 
 class TestStrategy(Strategy):
@@ -72,25 +58,6 @@ class TestStrategy(Strategy):
         self.next_runs += 1
 
 
-def backtesting(config):
-    cerebro = Cerebro()
-
-    cerebro.addstrategy(TestStrategy)
-
-    cerebro.adddata(CCXTFeed(exchange='binance',
-                             dataname='BNB/USDT',
-                             timeframe=TimeFrame.Minutes,
-                             fromdate=datetime(2019, 1, 1, 0, 0),
-                             todate=datetime(2019, 1, 1, 0, 2),
-                             compression=1,
-                             ohlcv_limit=2,
-                             currency='BNB',
-                             config=config,
-                             retries=5))
-
-    finished_strategies = cerebro.run()
-    return finished_strategies
-
 
 if __name__ == '__main__':
     unittest.main()